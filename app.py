@@ -1,22 +1,36 @@
 import dash
 from dash import dcc, html, Input, Output, State, dash_table
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
-import json
+from datetime import datetime
+import orjson
 import os
-from typing import List, Dict, Union, Optional
-from dataclasses import dataclass, asdict
+import bisect
+import threading
+from typing import List, Dict, Tuple, Union, Optional
+from dataclasses import dataclass
 from pathlib import Path
+from contextlib import contextmanager
 
-@dataclass
+try:
+    import numba as nb
+except ImportError:  # numba is optional; the NumPy balance curve is used without it
+    nb = None
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows; file locking is skipped there
+    fcntl = None
+
+@dataclass(slots=True)
 class Transaction:
     day: int
     amount: float
     name: str
     color: str
 
-@dataclass
+@dataclass(slots=True)
 class OneTimeTransaction:
     date: datetime
     amount: float
@@ -24,14 +38,154 @@ class OneTimeTransaction:
     name: str
     color: str
 
+@dataclass(slots=True)
+class ForecastResult:
+    """Forecast columns with one entry per transaction, or a placeholder per empty day"""
+    dates: np.ndarray
+    names: np.ndarray
+    income: np.ndarray
+    expense: np.ndarray
+    balance: np.ndarray
+
+    def to_records(self) -> List[Dict]:
+        """Rows for the forecast table"""
+        return [
+            {"Date": d, "Transaction": n, "Income": i, "Expense": e, "Balance": b}
+            for d, n, i, e, b in zip(
+                self.dates.tolist(), self.names.tolist(), self.income.tolist(),
+                self.expense.tolist(), self.balance.tolist()
+            )
+        ]
+
+def _index_by_day(days: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Group transaction indices by day of month
+
+    Returns the indices stably sorted by day and the bounds array, where
+    order[bounds[d]:bounds[d + 1]] are the transactions falling on day d.
+    """
+    order = np.argsort(days, kind='stable')
+    bounds = np.searchsorted(days[order], np.arange(33))
+    return order, bounds
+
+def _balance_curve_numpy(net: np.ndarray, initial: float) -> np.ndarray:
+    """Balance after each day, up to and including the first day it is exhausted"""
+    balance = initial + np.cumsum(net)
+    exhausted = balance <= 0
+    if exhausted.any():
+        return balance[:int(exhausted.argmax()) + 1]
+    return balance
+
+if nb is not None:
+    @nb.njit(cache=True)
+    def _balance_curve(net, initial):
+        """Compiled equivalent of _balance_curve_numpy for long horizons"""
+        balance = np.empty(net.size)
+        cumulative = 0.0
+        for day in range(net.size):
+            cumulative += net[day]
+            balance[day] = initial + cumulative
+            if balance[day] <= 0:
+                return balance[:day + 1]
+        return balance
+else:
+    _balance_curve = _balance_curve_numpy
+
+def _transaction_day(transaction: OneTimeTransaction):
+    """Sort key keeping one-time transactions in date order, same-day ones in insertion order"""
+    return transaction.date.date()
+
+def _validate_day(day) -> int:
+    """Day of month as an int, rejecting days the forecast could never match"""
+    if not 1 <= day <= 31:
+        raise ValueError("Day must be between 1 and 31")
+    if day != int(day):
+        raise ValueError("Day must be a whole number")
+    return int(day)
+
+def _parse_monthly(raw: List[Dict]) -> List[Transaction]:
+    """Build monthly transactions from stored entries, raising on an invalid one"""
+    # The dataclass does no type checking, so the day array built by
+    # _rebuild_arrays would otherwise truncate or reject bad values
+    return [
+        Transaction(
+            day=_validate_day(t['day']),
+            amount=float(t['amount']),
+            name=str(t['name']),
+            color=str(t['color'])
+        )
+        for t in raw
+    ]
+
+def _parse_log(log: bytes) -> List[Dict]:
+    """Entries of the one-time log, skipping lines that cannot be parsed
+
+    A crash during an append can leave a partial last line without its newline;
+    only newline-terminated lines are read.
+    """
+    entries = []
+    for line in log[:log.rfind(b'\n') + 1].splitlines():
+        if not line.strip():
+            continue
+        try:
+            entry = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            print(f"Skipping unreadable one-time log line: {e}")
+            continue
+        if isinstance(entry, dict):
+            entries.append(entry)
+    return entries
+
+def _parse_one_time(raw: List[Dict]) -> List[OneTimeTransaction]:
+    """Build one-time transactions from stored entries, skipping invalid ones"""
+    try:
+        # Parse all dates in a single batch; unparsable ones become NaT
+        dates = list(pd.to_datetime([t.get('date') for t in raw], format='ISO8601', errors='coerce'))
+    except (TypeError, ValueError):
+        # The batch fails as a whole, e.g. on mixed timezone-aware and naive dates,
+        # so each date is parsed on its own below
+        dates = [None] * len(raw)
+    transactions = []
+    for t, date in zip(raw, dates):
+        try:
+            if date is None:
+                date = pd.to_datetime(t['date'], format='ISO8601')
+            if pd.isna(date):
+                raise ValueError(f"invalid date {t.get('date')!r}")
+            # The dataclass does no type checking, so coerce the fields here rather
+            # than let a bad entry fail later in _rebuild_arrays
+            transactions.append(OneTimeTransaction(
+                date=date.to_pydatetime(),
+                amount=float(t['amount']),
+                type=str(t['type']),
+                name=str(t['name']),
+                color=str(t['color'])
+            ))
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"Skipping invalid one-time transaction: {e!r}")
+    return transactions
+
 class FinanceTracker:
     def __init__(self, initial_balance: float):
         self.data_file = Path('finance_data.json')
+        # One-time transactions are kept in an append-only JSON Lines log
+        self.one_time_file = Path('finance_one_time.jsonl')
+        # Advisory lock shared by every process reading or writing the files above
+        self.lock_file = Path('finance_data.lock')
         self.initial_balance: float = initial_balance
         self.current_balance: float = initial_balance
         self.monthly_incomes: List[Transaction] = []
         self.monthly_expenses: List[Transaction] = []
+        # Kept sorted by _transaction_day
         self.one_time_transactions: List[OneTimeTransaction] = []
+        self._unsaved_one_time: List[OneTimeTransaction] = []
+        # Last data file contents seen and how far the log has been read, so a
+        # refresh only parses what other processes saved since; None until read
+        self._data_bytes: Optional[bytes] = None
+        self._log_offset: Optional[int] = None
+        self._forecast_cache: Optional[Tuple[tuple, ForecastResult]] = None
+        self._dirty: bool = False
+        self._batch_depth: int = 0
+        self._rebuild_arrays()
         
         self.load_data()
         if not self.monthly_incomes and not self.monthly_expenses:
@@ -39,52 +193,181 @@ class FinanceTracker:
 
     def _set_default_transactions(self) -> None:
         """Set default monthly transactions if none exist"""
-        self.monthly_incomes = [
-            Transaction(day=21, amount=13000, name="Pension", color="green")
-        ]
+        with self.batch():
+            # Another process may have saved its own transactions since load_data
+            if self.monthly_incomes or self.monthly_expenses:
+                return
+            
+            self.monthly_incomes = [
+                Transaction(day=21, amount=13000, name="Pension", color="green")
+            ]
+            
+            self.monthly_expenses = [
+                Transaction(day=14, amount=35000, name="Rent", color="red"),
+                Transaction(day=22, amount=900, name="Internet", color="darkred")
+            ]
+            self._rebuild_arrays()
+            self._mark_dirty()
+
+    def _rebuild_arrays(self) -> None:
+        """Rebuild the column arrays read by the forecast from the transaction lists"""
+        self._inc_days = np.array([t.day for t in self.monthly_incomes], dtype=np.int8)
+        self._inc_amounts = np.array([t.amount for t in self.monthly_incomes], dtype=np.float64)
+        self._inc_names = np.array([t.name for t in self.monthly_incomes], dtype=object)
+        self._inc_by_day = _index_by_day(self._inc_days)
         
-        self.monthly_expenses = [
-            Transaction(day=14, amount=35000, name="Rent", color="red"),
-            Transaction(day=22, amount=900, name="Internet", color="darkred")
-        ]
-        self.save_data()
+        self._exp_days = np.array([t.day for t in self.monthly_expenses], dtype=np.int8)
+        self._exp_amounts = np.array([t.amount for t in self.monthly_expenses], dtype=np.float64)
+        self._exp_names = np.array([t.name for t in self.monthly_expenses], dtype=object)
+        self._exp_by_day = _index_by_day(self._exp_days)
+        
+        # Net monthly flow indexed by day of month
+        self._monthly_net = (
+            np.bincount(self._inc_days, weights=self._inc_amounts, minlength=32)
+            - np.bincount(self._exp_days, weights=self._exp_amounts, minlength=32)
+        )
+        
+        self._ot_dates = np.array([t.date.date() for t in self.one_time_transactions], dtype='datetime64[D]')
+        self._ot_amounts = np.array([t.amount for t in self.one_time_transactions], dtype=np.float64)
+        self._ot_names = np.array([t.name for t in self.one_time_transactions], dtype=object)
+        
+        # Transactions changed, so any cached forecast is stale
+        self._forecast_cache = None
+
+    def _mark_dirty(self) -> None:
+        """Flag unsaved changes; the enclosing batch saves them on exit"""
+        self._dirty = True
+
+    @contextmanager
+    def batch(self):
+        """Apply mutations to the latest saved state and save them once under the exclusive lock
+        
+        The outermost batch holds the lock from the refresh to the save, so processes
+        sharing the data files never overwrite each other's changes.
+        """
+        outermost = not self._batch_depth
+        self._batch_depth += 1
+        try:
+            if outermost:
+                with self._file_lock(exclusive=True):
+                    self._refresh()
+                    try:
+                        yield self
+                    finally:
+                        if self._dirty:
+                            self.save_data()
+            else:
+                yield self
+        finally:
+            self._batch_depth -= 1
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        """Hold a shared or exclusive lock on the data files across processes"""
+        with self.lock_file.open('a') as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
 
     def load_data(self) -> None:
-        """Load data from JSON file with error handling"""
+        """Load monthly data from JSON and one-time transactions from their log with error handling"""
+        with self._file_lock(exclusive=False):
+            self._refresh()
+
+    def _refresh(self) -> None:
+        """Pick up whatever was saved to the data file and the log since they were last read
+        
+        Callers hold the file lock.
+        """
+        changed = False
         try:
-            if self.data_file.exists():
-                data = json.loads(self.data_file.read_text())
+            data_bytes = self.data_file.read_bytes() if self.data_file.exists() else None
+            if data_bytes is not None and data_bytes != self._data_bytes:
+                data = orjson.loads(data_bytes)
+                # Convert dictionaries to dataclass instances
+                monthly_incomes = _parse_monthly(data.get('monthly_incomes', []))
+                monthly_expenses = _parse_monthly(data.get('monthly_expenses', []))
+                
                 self.initial_balance = data.get('initial_balance', self.initial_balance)
                 self.current_balance = data.get('current_balance', self.current_balance)
+                self.monthly_incomes = monthly_incomes
+                self.monthly_expenses = monthly_expenses
+                self._data_bytes = data_bytes
+                changed = True
                 
-                # Convert dictionaries to dataclass instances
-                self.monthly_incomes = [Transaction(**t) for t in data.get('monthly_incomes', [])]
-                self.monthly_expenses = [Transaction(**t) for t in data.get('monthly_expenses', [])]
-                
-                # Handle datetime conversion for one-time transactions
-                self.one_time_transactions = []
-                for t in data.get('one_time_transactions', []):
-                    t['date'] = datetime.fromisoformat(t['date'])
-                    self.one_time_transactions.append(OneTimeTransaction(**t))
+                if not self.one_time_file.exists():
+                    # Older data files keep one-time transactions inline. They are read
+                    # only while no log exists, so once any process has moved them to
+                    # the log they cannot be loaded twice
+                    inline = _parse_one_time(data.get('one_time_transactions', []))
+                    self._unsaved_one_time = inline
+                    self.one_time_transactions = sorted(inline, key=_transaction_day)
         except Exception as e:
             print(f"Error loading data: {e}")
-            self._set_default_transactions()
+        
+        # Log problems only skip entries, never reset the monthly data above
+        try:
+            if self.one_time_file.exists():
+                if self._log_offset is None:
+                    # The log supersedes any inline transactions read before it existed
+                    self.one_time_transactions = []
+                    self._unsaved_one_time = []
+                    self._log_offset = 0
+                    changed = True
+                with self.one_time_file.open('rb') as f:
+                    f.seek(self._log_offset)
+                    tail = f.read()
+                # A partial last line is left for save_data to drop
+                tail = tail[:tail.rfind(b'\n') + 1]
+                if tail:
+                    self._log_offset += len(tail)
+                    # The stable sort keeps same-day transactions in the order they were added
+                    self.one_time_transactions.extend(_parse_one_time(_parse_log(tail)))
+                    self.one_time_transactions.sort(key=_transaction_day)
+                    changed = True
+        except OSError as e:
+            print(f"Error loading one-time transactions: {e}")
+        
+        if changed:
+            self._rebuild_arrays()
 
     def save_data(self) -> None:
-        """Save current state to JSON file with error handling"""
+        """Save monthly data to JSON and append new one-time transactions to their log with error handling
+        
+        Called by batch with the exclusive file lock held.
+        """
         try:
+            # The log is append-only, so only transactions added since the last save are written
+            log_lines = [
+                orjson.dumps(t, option=orjson.OPT_APPEND_NEWLINE)
+                for t in self._unsaved_one_time
+            ]
+            
+            # orjson serializes dataclasses natively
             data = {
                 'initial_balance': self.initial_balance,
                 'current_balance': self.current_balance,
-                'monthly_incomes': [asdict(t) for t in self.monthly_incomes],
-                'monthly_expenses': [asdict(t) for t in self.monthly_expenses],
-                'one_time_transactions': [
-                    {**asdict(t), 'date': t.date.isoformat()} 
-                    for t in self.one_time_transactions
-                ]
+                'monthly_incomes': self.monthly_incomes,
+                'monthly_expenses': self.monthly_expenses
             }
+            payload = orjson.dumps(data)
             
-            self.data_file.write_text(json.dumps(data, indent=2))
+            if log_lines:
+                with self.one_time_file.open('a+b') as f:
+                    # _refresh has read every complete line, so anything past that is a
+                    # partial line left by a crash; drop it so the append starts cleanly
+                    if self._log_offset is not None:
+                        f.truncate(self._log_offset)
+                    f.writelines(log_lines)
+                    self._log_offset = f.tell()
+                self._unsaved_one_time = []
+            
+            # Write to a temporary file first so a crash never leaves a truncated file
+            tmp_file = self.data_file.with_suffix('.tmp')
+            tmp_file.write_bytes(payload)
+            tmp_file.replace(self.data_file)
+            self._data_bytes = payload
+            self._dirty = False
         except Exception as e:
             print(f"Error saving data: {e}")
 
@@ -94,14 +377,18 @@ class FinanceTracker:
         if amount <= 0:
             raise ValueError("Income amount must be positive")
             
-        self.one_time_transactions.append(OneTimeTransaction(
-            date=date or datetime.now(),
-            amount=amount,
-            type="income",
-            name=name or "One-time Income",
-            color=color
-        ))
-        self.save_data()
+        with self.batch():
+            transaction = OneTimeTransaction(
+                date=date or datetime.now(),
+                amount=amount,
+                type="income",
+                name=name or "One-time Income",
+                color=color
+            )
+            bisect.insort(self.one_time_transactions, transaction, key=_transaction_day)
+            self._unsaved_one_time.append(transaction)
+            self._rebuild_arrays()
+            self._mark_dirty()
 
     def add_expense(self, amount: float, date: Optional[datetime] = None,
                    name: Optional[str] = None, color: str = "red") -> None:
@@ -109,149 +396,159 @@ class FinanceTracker:
         if amount <= 0:
             raise ValueError("Expense amount must be positive")
             
-        self.one_time_transactions.append(OneTimeTransaction(
-            date=date or datetime.now(),
-            amount=-amount,
-            type="expense",
-            name=name or "One-time Expense",
-            color=color
-        ))
-        self.save_data()
+        with self.batch():
+            transaction = OneTimeTransaction(
+                date=date or datetime.now(),
+                amount=-amount,
+                type="expense",
+                name=name or "One-time Expense",
+                color=color
+            )
+            bisect.insort(self.one_time_transactions, transaction, key=_transaction_day)
+            self._unsaved_one_time.append(transaction)
+            self._rebuild_arrays()
+            self._mark_dirty()
 
     def add_monthly_income(self, day: int, amount: float, name: str, 
                          color: str = "green") -> None:
         """Add monthly income with validation"""
-        if not 1 <= day <= 31:
-            raise ValueError("Day must be between 1 and 31")
+        day = _validate_day(day)
         if amount <= 0:
             raise ValueError("Income amount must be positive")
             
-        self.monthly_incomes.append(Transaction(
-            day=day,
-            amount=amount,
-            name=name,
-            color=color
-        ))
-        self.save_data()
+        with self.batch():
+            self.monthly_incomes.append(Transaction(
+                day=day,
+                amount=amount,
+                name=name,
+                color=color
+            ))
+            self._rebuild_arrays()
+            self._mark_dirty()
 
     def add_monthly_expense(self, day: int, amount: float, name: str,
                           color: str = "red") -> None:
         """Add monthly expense with validation"""
-        if not 1 <= day <= 31:
-            raise ValueError("Day must be between 1 and 31")
+        day = _validate_day(day)
         if amount <= 0:
             raise ValueError("Expense amount must be positive")
             
-        self.monthly_expenses.append(Transaction(
-            day=day,
-            amount=amount,
-            name=name,
-            color=color
-        ))
-        self.save_data()
+        with self.batch():
+            self.monthly_expenses.append(Transaction(
+                day=day,
+                amount=amount,
+                name=name,
+                color=color
+            ))
+            self._rebuild_arrays()
+            self._mark_dirty()
 
     def update_initial_balance(self, balance: float) -> None:
         """Update initial balance with validation"""
         if balance < 0:
             raise ValueError("Initial balance cannot be negative")
             
-        self.initial_balance = balance
-        self.current_balance = balance
-        self.save_data()
+        with self.batch():
+            self.initial_balance = balance
+            self.current_balance = balance
+            self._mark_dirty()
 
-    def generate_daily_forecast(self, max_days: int = 180) -> pd.DataFrame:
-        """Generate daily forecast with improved performance"""
+    def generate_daily_forecast(self, max_days: int = 180) -> ForecastResult:
+        """Generate daily forecast with vectorized date arithmetic"""
         start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        forecast_data = []
-        current_balance = self.initial_balance
         
-        # Pre-sort one-time transactions for better performance
-        sorted_transactions = sorted(
-            self.one_time_transactions,
-            key=lambda x: x.date.date()
-        )
+        # Transaction changes clear the cache; the rest of the inputs form the key
+        cache_key = (start_date, max_days, self.initial_balance)
+        if self._forecast_cache is not None and self._forecast_cache[0] == cache_key:
+            return self._forecast_cache[1]
         
-        for day_offset in range(max_days):
-            current_date = start_date + timedelta(days=day_offset)
-            day_transactions = []
-            
-            # Add monthly transactions
-            if any(income.day == current_date.day for income in self.monthly_incomes):
-                day_transactions.extend([
-                    {
-                        "type": "income",
-                        "name": income.name,
-                        "amount": income.amount,
-                        "color": income.color
-                    }
-                    for income in self.monthly_incomes
-                    if income.day == current_date.day
-                ])
-            
-            if any(expense.day == current_date.day for expense in self.monthly_expenses):
-                day_transactions.extend([
-                    {
-                        "type": "expense",
-                        "name": expense.name,
-                        "amount": -expense.amount,
-                        "color": expense.color
-                    }
-                    for expense in self.monthly_expenses
-                    if expense.day == current_date.day
-                ])
-            
-            # Add one-time transactions
-            day_transactions.extend([
-                {
-                    "type": t.type,
-                    "name": t.name,
-                    "amount": t.amount,
-                    "color": t.color
-                }
-                for t in sorted_transactions
-                if t.date.date() == current_date.date()
-            ])
-            
-            # Update balance
-            for transaction in day_transactions:
-                current_balance += transaction['amount']
-            
-            forecast_data.append({
-                "date": current_date,
-                "transactions": day_transactions,
-                "balance": current_balance
-            })
-            
-            if current_balance <= 0:
-                break
+        start_day = np.datetime64(start_date.date(), 'D')
+        dates = start_day + np.arange(max_days)
+        dom = (dates - dates.astype('datetime64[M]')).astype(np.int64) + 1
+        
+        # One-time dates are sorted, so the window is a binary-searched slice
+        ot_lo, ot_hi = np.searchsorted(self._ot_dates, np.array([start_day, start_day + max_days]))
+        ot_offsets = (self._ot_dates[ot_lo:ot_hi] - start_day).astype(np.int64)
+        ot_names = self._ot_names[ot_lo:ot_hi]
+        ot_amounts = self._ot_amounts[ot_lo:ot_hi]
+        
+        # Daily net flow: the monthly net for each day of month plus one-time amounts
+        net = self._monthly_net[dom] + np.bincount(ot_offsets, weights=ot_amounts, minlength=max_days)
         
-        return self._create_forecast_dataframe(forecast_data)
+        # Balance curve, stopping at the first day the balance is exhausted
+        balance = _balance_curve(net, float(self.initial_balance))
+        stop = balance.size
+        
+        # Every transaction up to the stop becomes an event at a day offset;
+        # incomes, expenses and one-time transactions are collected in that order
+        offsets, names, amounts = [], [], []
+        day_index = np.arange(stop)
+        dom = dom[:stop]
+        for (order, bounds), tx_amounts, tx_names, sign in (
+            (self._inc_by_day, self._inc_amounts, self._inc_names, 1),
+            (self._exp_by_day, self._exp_amounts, self._exp_names, -1)
+        ):
+            # Look up each day's transactions instead of scanning them all per day
+            lo, hi = bounds[dom], bounds[dom + 1]
+            counts = hi - lo
+            hits = np.repeat(day_index, counts)
+            within_day = np.arange(hits.size) - np.repeat(np.cumsum(counts) - counts, counts)
+            tx_idx = order[np.repeat(lo, counts) + within_day]
+            offsets.append(hits)
+            names.append(tx_names[tx_idx])
+            amounts.append(sign * tx_amounts[tx_idx])
+        
+        ot_count = np.searchsorted(ot_offsets, stop)
+        offsets.append(ot_offsets[:ot_count])
+        names.append(ot_names[:ot_count])
+        amounts.append(ot_amounts[:ot_count])
+        
+        forecast = self._create_forecast_result(
+            dates,
+            balance,
+            np.concatenate(offsets),
+            np.concatenate(names),
+            np.concatenate(amounts)
+        )
+        self._forecast_cache = (cache_key, forecast)
+        return forecast
     
-    def _create_forecast_dataframe(self, forecast_data: List[Dict]) -> pd.DataFrame:
-        """Create forecast DataFrame with improved efficiency"""
-        rows = []
-        for entry in forecast_data:
-            if entry['transactions']:
-                rows.extend([
-                    {
-                        "Date": entry['date'].strftime("%Y-%m-%d"),
-                        "Transaction": transaction['name'],
-                        "Income": abs(transaction['amount']) if transaction['amount'] > 0 else 0,
-                        "Expense": abs(transaction['amount']) if transaction['amount'] < 0 else 0,
-                        "Balance": entry['balance']
-                    }
-                    for transaction in entry['transactions']
-                ])
-            else:
-                rows.append({
-                    "Date": entry['date'].strftime("%Y-%m-%d"),
-                    "Transaction": "-",
-                    "Income": 0,
-                    "Expense": 0,
-                    "Balance": entry['balance']
-                })
+    def _create_forecast_result(self, dates: np.ndarray, balance: np.ndarray,
+                                offsets: np.ndarray, names: np.ndarray,
+                                amounts: np.ndarray) -> ForecastResult:
+        """Create forecast columns with one row per transaction, or a placeholder row per empty day"""
+        stop = balance.size
+        empty_days = np.setdiff1d(np.arange(stop), offsets)
+        offsets = np.concatenate([offsets, empty_days])
+        names = np.concatenate([names, np.full(empty_days.size, "-", dtype=object)])
+        amounts = np.concatenate([amounts, np.zeros(empty_days.size)])
+        
+        # Stable sort keeps the per-day transaction order
+        order = np.argsort(offsets, kind='stable')
+        offsets, names, amounts = offsets[order], names[order], amounts[order]
+        
+        # Format each day once; rows on the same day share its label
+        day_labels = np.datetime_as_string(dates[:stop], unit='D').astype(object)
         
-        return pd.DataFrame(rows)
+        return ForecastResult(
+            dates=day_labels[offsets],
+            names=names,
+            income=np.where(amounts > 0, amounts, 0),
+            expense=np.where(amounts < 0, -amounts, 0),
+            balance=balance[offsets]
+        )
+
+# One tracker per process, shared by every app and callback thread
+_tracker_lock = threading.RLock()
+_tracker: Optional[FinanceTracker] = None
+
+def get_tracker() -> FinanceTracker:
+    """Return the process-wide FinanceTracker, creating it on first use"""
+    global _tracker
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = FinanceTracker(0)
+        return _tracker
 
 # Styles
 STYLES = {
@@ -290,6 +587,35 @@ STYLES = {
     }
 }
 
+# Forecast figure layout, validated once at import and shared by every render as a plain
+# dict; building it through go.Figure applies the default template like before
+FORECAST_LAYOUT = go.Figure(layout=go.Layout(
+    xaxis_title='Date',
+    yaxis_title='Amount',
+    barmode='group',
+    plot_bgcolor='white',
+    paper_bgcolor='white',
+    font_family='Inter, sans-serif',
+    margin=dict(t=10),
+    legend=dict(
+        orientation="h",
+        yanchor="bottom",
+        y=1.02,
+        xanchor="right",
+        x=1
+    ),
+    xaxis=dict(
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='#f0f0f0'
+    ),
+    yaxis=dict(
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='#f0f0f0'
+    )
+)).to_dict()['layout']
+
 def create_app():
     """Create and configure Dash application"""
     app = dash.Dash(
@@ -300,7 +626,9 @@ def create_app():
     )
     server = app.server
     # Initialize FinanceTracker
-    tracker = FinanceTracker(0)
+    tracker = get_tracker()
+    # Table data and figure of the last rendered forecast
+    render_cache = {'forecast': None, 'output': None}
     
     app.layout = html.Div(style=STYLES['content'], children=[
         html.H1("Панель финансового прогноза", style={
@@ -551,21 +879,23 @@ def create_app():
             button_id = ctx.triggered[0]['prop_id'].split('.')[0]
         
         try:
-            if button_id == 'update-balance-button' and initial_balance is not None:
-                tracker.update_initial_balance(initial_balance)
+            # One user action is saved once, however many mutations it makes
+            with _tracker_lock, tracker.batch():
+                if button_id == 'update-balance-button' and initial_balance is not None:
+                    tracker.update_initial_balance(initial_balance)
             
-            elif button_id == 'add-monthly-income-button' and all([income_day, income_amount, income_name]):
-                tracker.add_monthly_income(income_day, income_amount, income_name)
+                elif button_id == 'add-monthly-income-button' and all([income_day, income_amount, income_name]):
+                    tracker.add_monthly_income(income_day, income_amount, income_name)
             
-            elif button_id == 'add-monthly-expense-button' and all([expense_day, expense_amount, expense_name]):
-                tracker.add_monthly_expense(expense_day, expense_amount, expense_name)
+                elif button_id == 'add-monthly-expense-button' and all([expense_day, expense_amount, expense_name]):
+                    tracker.add_monthly_expense(expense_day, expense_amount, expense_name)
             
-            elif button_id == 'add-transaction-button' and all([transaction_date, transaction_amount, transaction_name]):
-                date = datetime.strptime(transaction_date, '%Y-%m-%d')
-                if transaction_type == 'income':
-                    tracker.add_income(transaction_amount, date, transaction_name)
-                else:
-                    tracker.add_expense(transaction_amount, date, transaction_name)
+                elif button_id == 'add-transaction-button' and all([transaction_date, transaction_amount, transaction_name]):
+                    date = datetime.strptime(transaction_date, '%Y-%m-%d')
+                    if transaction_type == 'income':
+                        tracker.add_income(transaction_amount, date, transaction_name)
+                    else:
+                        tracker.add_expense(transaction_amount, date, transaction_name)
         
         except ValueError as e:
             print(f"Validation error: {e}")
@@ -575,67 +905,46 @@ def create_app():
             # You might want to add some UI feedback here
         
         # Generate forecast
-        forecast_df = tracker.generate_daily_forecast()
-        
-        # Create figure
-        fig = go.Figure()
-        
-        # Add area plot for balance
-        fig.add_trace(go.Scatter(
-            x=forecast_df['Date'],
-            y=forecast_df['Balance'],
-            fill='tozeroy',
-            mode='lines+markers',
-            name='Balance',
-            line=dict(color='#4299e1')
-        ))
-        
-        # Add bar plots for income and expenses
-        fig.add_trace(go.Bar(
-            x=forecast_df['Date'],
-            y=forecast_df['Expense'],
-            name='Expense',
-            marker=dict(color='#fc8181')
-        ))
-        
-        fig.add_trace(go.Bar(
-            x=forecast_df['Date'],
-            y=forecast_df['Income'],
-            name='Income',
-            marker=dict(color='#68d391')
-        ))
+        with _tracker_lock:
+            forecast = tracker.generate_daily_forecast()
+        if render_cache['forecast'] is forecast:
+            return render_cache['output']
         
-        # Update layout
-        fig.update_layout(
-            xaxis_title='Date',
-            yaxis_title='Amount',
-            barmode='group',
-            plot_bgcolor='white',
-            paper_bgcolor='white',
-            font_family='Inter, sans-serif',
-            margin=dict(t=10),
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            )
-        )
-        
-        # Update axes
-        fig.update_xaxes(
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='#f0f0f0'
-        )
-        fig.update_yaxes(
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='#f0f0f0'
-        )
+        # Figure as a plain dict: Dash serializes it as is, skipping go.Figure validation
+        fig = {
+            'data': [
+                # Area plot for balance
+                {
+                    'type': 'scatter',
+                    'x': forecast.dates,
+                    'y': forecast.balance,
+                    'fill': 'tozeroy',
+                    'mode': 'lines+markers',
+                    'name': 'Balance',
+                    'line': {'color': '#4299e1'}
+                },
+                # Bar plots for income and expenses
+                {
+                    'type': 'bar',
+                    'x': forecast.dates,
+                    'y': forecast.expense,
+                    'name': 'Expense',
+                    'marker': {'color': '#fc8181'}
+                },
+                {
+                    'type': 'bar',
+                    'x': forecast.dates,
+                    'y': forecast.income,
+                    'name': 'Income',
+                    'marker': {'color': '#68d391'}
+                }
+            ],
+            'layout': FORECAST_LAYOUT
+        }
         
-        return forecast_df.to_dict('records'), fig
+        output = forecast.to_records(), fig
+        render_cache.update(forecast=forecast, output=output)
+        return output
 
     return app
 